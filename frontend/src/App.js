@@ -53,6 +53,7 @@ function App() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [lastUpdated, setLastUpdated] = useState(new Date());
+  const [stale, setStale] = useState(false);
   const prefersDarkMode = useMediaQuery('(prefers-color-scheme: dark)');
 
   const theme = createTheme({
@@ -111,7 +112,13 @@ function App() {
       console.log('Fetching data from:', `${API_URL}/api/gpu-status`);
       const response = await axios.get(`${API_URL}/api/gpu-status`);
       setGpuData(response.data);
-      setLastUpdated(new Date());
+      // The backend couldn't reach the server and sent its last known data
+      if (response.data.error) {
+        setStale(true);
+      } else {
+        setStale(false);
+        setLastUpdated(new Date());
+      }
       setError(null);
     } catch (err) {
       console.error('Error fetching data:', err);
@@ -183,8 +190,9 @@ function App() {
 
         <Container maxWidth="lg">
           <Box sx={{ mb: 1, display: 'flex', justifyContent: 'flex-end' }}>
-            <Typography variant="caption" color="text.secondary">
+            <Typography variant="caption" color={stale ? 'warning.main' : 'text.secondary'}>
               Last updated: {lastUpdated.toLocaleTimeString()}
+              {stale && ' (server unreachable, showing the last known data)'}
             </Typography>
           </Box>
 
@@ -497,7 +505,7 @@ function App() {
                             Memory Usage
                           </Typography>
                           <Typography variant="body2" color="text.secondary">
-                            {gpu.memory_used} / {gpu.memory_total}
+                            {(gpu.memory_used / 1024).toFixed(1)}G / {(gpu.memory_total / 1024).toFixed(1)}G
                           </Typography>
                         </Box>
                         <LinearProgress
@@ -523,10 +531,10 @@ function App() {
                                 Temperature
                               </Typography>
                               <Typography variant="h6" sx={{ 
-                                color: getProgressColor(parseInt(gpu.temperature) * 1.1),
+                                color: gpu.temperature == null ? 'text.secondary' : getProgressColor(gpu.temperature * 1.1),
                                 fontWeight: 'bold'
                               }}>
-                                {gpu.temperature}°C
+                                {gpu.temperature == null ? 'N/A' : `${gpu.temperature}°C`}
                               </Typography>
                             </CardContent>
                           </Card>
@@ -538,7 +546,7 @@ function App() {
                                 Power Usage
                               </Typography>
                               <Typography variant="h6" sx={{ fontWeight: 'bold' }}>
-                                {gpu.power_usage}W
+                                {gpu.power_usage == null ? 'N/A' : `${gpu.power_usage}W`}
                               </Typography>
                             </CardContent>
                           </Card>
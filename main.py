@@ -1,34 +1,112 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-import paramiko
+from fastapi.responses import ORJSONResponse
+import asyncssh
 import json
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional
 import os
 from dotenv import load_dotenv
-import traceback
 import logging
-import socket
 import time
 import base64
-import tempfile
+import csv
+import io
+import re
+import hashlib
+import shlex
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from collections import defaultdict
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Load .env before any setting below is read from the environment
 load_dotenv()
 
-app = FastAPI()
+# who line: name, terminal, login time and an optional "(host)" comment. The time
+# is matched as a whole since its format depends on the locale and who version
+_WHO_LINE_RE = re.compile(r"^(\S+)\s+(\S+)\s+(.+?)(?:\s+\((.*)\))?\s*$")
+
+# Force English locale for commands to ensure consistent parsing
+LOCALE_PREFIX = "export LC_ALL=C; "
+
+# Seconds a user's home directory size is reused, du walks the whole tree
+HOME_SIZE_CACHE_TTL = 3600
+HOME_SIZE_TIMEOUT = 600
+
+GPU_QUERY = "nvidia-smi --query-gpu=index,memory.used,memory.total,temperature.gpu,power.draw --format=csv,noheader,nounits"
+# GPU names never change while connected, so they are only queried once per connection
+GPU_NAMES_QUERY = "nvidia-smi --query-gpu=index,name --format=csv,noheader"
+
+# nvidia-smi kept running in loop mode on the server, so polls don't fork it every time
+GPU_STREAM_INTERVAL_MS = int(os.getenv("GPU_STREAM_INTERVAL_MS", "1000"))
+GPU_STREAM_COMMAND = f"{GPU_QUERY} -lms {GPU_STREAM_INTERVAL_MS}"
+# Rows older than this are considered stale and the GPU query runs per poll instead
+GPU_STREAM_MAX_AGE = 5 * GPU_STREAM_INTERVAL_MS / 1000
+GPU_STREAM_RETRY = 30
+
+# NVML based agent streaming the same rows without forking nvidia-smi. It is sent on
+# stdin, so the server only needs python3 and pynvml, otherwise nvidia-smi is used
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "remote_agent.py")) as agent_file:
+    GPU_AGENT_SCRIPT = agent_file.read()
+GPU_AGENT_COMMAND = f"python3 -u - --interval {GPU_STREAM_INTERVAL_MS / 1000}"
+# The agent also sends GPU memory per user on a line starting with this
+GPU_AGENT_USERS_PREFIX = "users"
+
+# Mount points counted in the storage summary
+STORAGE_MOUNTS = frozenset({"/mnt/storage_1_10T", "/mnt/storage_2_10T", "/mnt/user_disk"})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the background collection while the app is up, close SSH connections on shutdown"""
+    await start_background_tasks()
+    yield
+    await close_ssh_connections()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Enable CORS for the dashboard only. FRONTEND_ORIGIN may list several origins separated by commas,
+# the default covers the development server and the nginx frontend image
+DEFAULT_FRONTEND_ORIGINS = "http://localhost:3000,http://localhost"
+if not os.getenv("FRONTEND_ORIGIN"):
+    logger.warning("FRONTEND_ORIGIN is not set, only %s may call the API", DEFAULT_FRONTEND_ORIGINS)
+FRONTEND_ORIGINS = [origin.strip() for origin in (os.getenv("FRONTEND_ORIGIN") or DEFAULT_FRONTEND_ORIGINS).split(",") if origin.strip()]
 
-# Enable CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_origins=FRONTEND_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET"],
     allow_headers=["*"],
+    # Let browsers reuse preflight responses for a day
+    max_age=86400,
 )
 
+@lru_cache(maxsize=None)
+def load_private_key(key_filename: Optional[str], key_content: Optional[str]) -> Optional[asyncssh.SSHKey]:
+    """Parse the configured private key once per process"""
+    if key_filename:
+        # Expand the home directory if needed
+        key_path = os.path.expanduser(key_filename)
+        logger.info("Loading key file: %s", key_path)
+        if not os.path.exists(key_path):
+            logger.error("SSH key file not found: %s", key_path)
+            raise FileNotFoundError(f"SSH key file not found: {key_path}")
+        with open(key_path) as key_file:
+            key_data = key_file.read()
+    elif key_content:
+        logger.info("Loading key content from environment variable")
+        # Decode base64 encoded key content
+        key_data = base64.b64decode(key_content).decode('utf-8')
+    else:
+        return None
+    
+    return asyncssh.import_private_key(key_data)
+
 class SSHConfig:
     def __init__(self):
         self.hostname = os.getenv("SSH_HOST")
@@ -37,135 +115,405 @@ class SSHConfig:
         self.key_filename = os.getenv("SSH_KEY_FILE")
         self.key_content = os.getenv("SSH_KEY_CONTENT")
         
-        logger.info(f"SSH Config: host={self.hostname}, user={self.username}, key_file={self.key_filename}")
+        logger.info("SSH Config: host=%s, user=%s, key_file=%s", self.hostname, self.username, self.key_filename)
 
-    def get_client(self):
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        
-        # Set connection timeout
-        socket.setdefaulttimeout(10)
-        
+    async def connect(self, keepalive: int = 30) -> asyncssh.SSHClientConnection:
         try:
-            # Handle SSH key as file
-            if self.key_filename:
-                logger.info(f"Connecting with key file: {self.key_filename}")
-                # Expand the home directory if needed
-                key_path = os.path.expanduser(self.key_filename)
-                logger.info(f"Expanded key path: {key_path}")
-                
-                if not os.path.exists(key_path):
-                    logger.error(f"SSH key file not found: {key_path}")
-                    raise FileNotFoundError(f"SSH key file not found: {key_path}")
-                
-                client.connect(
-                    hostname=self.hostname,
-                    username=self.username,
-                    key_filename=key_path,
-                    timeout=10,
-                    banner_timeout=10
-                )
-            # Handle SSH key as content in environment variable
-            elif self.key_content:
-                logger.info("Connecting with key content from environment variable")
-                try:
-                    # Decode base64 encoded key content
-                    key_data = base64.b64decode(self.key_content).decode('utf-8')
-                    
-                    # Create a temporary file to store the key
-                    with tempfile.NamedTemporaryFile(delete=False) as key_file:
-                        key_file.write(key_data.encode('utf-8'))
-                        key_path = key_file.name
-                    
-                    # Set proper permissions on the key file
-                    os.chmod(key_path, 0o600)
-                    
-                    try:
-                        client.connect(
-                            hostname=self.hostname,
-                            username=self.username,
-                            key_filename=key_path,
-                            timeout=10,
-                            banner_timeout=10
-                        )
-                    finally:
-                        # Clean up the temporary file
-                        os.unlink(key_path)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing SSH key content: {str(e)}")
-                    raise
+            pkey = load_private_key(self.key_filename, self.key_content)
+            # Only use the configured credentials, skip probing the agent and ~/.ssh
+            connect_args = {
+                'username': self.username,
+                'known_hosts': None,
+                'agent_path': None,
+                'connect_timeout': 10,
+                'login_timeout': 10,
+                'keepalive_interval': keepalive,
+                'keepalive_count_max': 3
+            }
+            if pkey is not None:
+                logger.info("Connecting with private key")
+                conn = await asyncssh.connect(self.hostname, client_keys=[pkey], **connect_args)
             else:
                 logger.info("Connecting with password")
-                client.connect(
-                    hostname=self.hostname,
-                    username=self.username,
-                    password=self.password,
-                    timeout=10,
-                    banner_timeout=10
-                )
+                conn = await asyncssh.connect(self.hostname, password=self.password, client_keys=None, **connect_args)
             logger.info("SSH connection successful")
-            return client
-        except Exception as e:
-            logger.error(f"SSH connection failed: {str(e)}")
-            logger.error(traceback.format_exc())
+            return conn
+        except Exception:
+            logger.exception("SSH connection failed")
+            raise
+
+    def pool_key(self):
+        """Identify the SSH endpoint and credentials a pooled connection belongs to"""
+        secret = self.key_content or self.key_filename or self.password or ''
+        key_fingerprint = hashlib.sha256(secret.encode('utf-8')).hexdigest()
+        return (self.hostname, self.username, key_fingerprint)
+
+# The environment doesn't change while running, so the config is read once
+SSH_CONFIG = SSHConfig()
+
+# Errors meaning the pooled connection itself is unusable. Not OSError: command timeouts
+# subclass TimeoutError on Python 3.11+ and leave the connection itself healthy
+CONNECTION_ERRORS = (asyncssh.DisconnectError, asyncssh.ChannelOpenError, ConnectionError)
+
+# Failing work is paused for an exponentially growing time, up to this many seconds
+BACKOFF_MAX = 600
+
+class Backoff:
+    """Pause work after consecutive failures: 2s, 4s, 8s... up to BACKOFF_MAX"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.failures = 0
+        self.open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+
+    def failed(self):
+        self.failures += 1
+        backoff = min(BACKOFF_MAX, 2 ** self.failures)
+        self.open_until = time.monotonic() + backoff
+        logger.warning("%s failed %d times in a row, pausing for %ds", self.name, self.failures, backoff)
+
+    def succeeded(self):
+        self.failures = 0
+
+class SSHConnectionPool:
+    """Keep an authenticated SSH connection alive across requests, commands share it as channels"""
+
+    def __init__(self, ssh_config: SSHConfig, keepalive: int = 30):
+        self.ssh_config = ssh_config
+        self.keepalive = keepalive
+        self._conn: Optional[asyncssh.SSHClientConnection] = None
+        self._connect_lock = asyncio.Lock()
+        # Home directory sizes in KB per user, as (refreshed at, size)
+        self._du_cache: Dict[str, Tuple[float, int]] = {}
+        self._du_refreshing = set()
+        self._du_tasks = set()
+        # Last /proc/stat reading as (idle, total) jiffies
+        self._cpu_sample: Optional[Tuple[int, int]] = None
+        # Latest nvidia-smi row per GPU index from the background stream
+        self._gpu_rows: Dict[str, str] = {}
+        self._gpu_updated = 0.0
+        # Latest "user MiB" lines from the NVML agent, like the gpu_users command prints
+        self._gpu_users: Optional[str] = None
+        self._gpu_users_updated = 0.0
+        self._gpu_task: Optional[asyncio.Task] = None
+        # Static host facts, fetched once per connection
+        self.cpu_cores: Optional[str] = None
+        self.gpu_names: Optional[Dict[str, str]] = None
+        # Keeps a missing or broken nvidia-smi from being forked on every poll
+        self.gpu_backoff = Backoff("GPU query")
+
+    async def _acquire(self) -> asyncssh.SSHClientConnection:
+        async with self._connect_lock:
+            if self._conn is not None and not self._conn.is_closed():
+                return self._conn
+            if self._conn is not None:
+                logger.info("Evicting stale pooled SSH connection")
+                self._conn.close()
+            self._conn = await self.ssh_config.connect(self.keepalive)
+            self.cpu_cores = None
+            self.gpu_names = None
+            return self._conn
+
+    def _evict(self, conn: asyncssh.SSHClientConnection):
+        conn.close()
+        if self._conn is conn:
+            self._conn = None
+
+    @asynccontextmanager
+    async def borrow(self):
+        conn = await self._acquire()
+        try:
+            yield conn
+        except CONNECTION_ERRORS:
+            # The connection is in an unknown state, force a re-auth next time
+            self._evict(conn)
             raise
 
-def parse_nvidia_smi(output: str) -> List[Dict]:
+    def home_sizes(self, usernames: List[str]) -> Dict[str, int]:
+        """Return cached home directory sizes in KB, refreshing stale ones in the background"""
+        now = time.monotonic()
+        stale = [
+            username for username in usernames
+            if username not in self._du_refreshing
+            and (username not in self._du_cache or now - self._du_cache[username][0] >= HOME_SIZE_CACHE_TTL)
+        ]
+        self._du_refreshing.update(stale)
+        sizes = {username: self._du_cache[username][1] for username in usernames if username in self._du_cache}
+        
+        if stale:
+            task = asyncio.create_task(self._refresh_home_sizes(stale))
+            # Keep a reference so the task is not garbage collected while du runs
+            self._du_tasks.add(task)
+            task.add_done_callback(self._du_tasks.discard)
+        return sizes
+
+    async def _refresh_home_sizes(self, usernames: List[str]):
+        try:
+            homes = ' '.join(shlex.quote(f"/home/{username}") for username in usernames)
+            async with self.borrow() as conn:
+                result = await conn.run(f"du -s {homes} 2>/dev/null", timeout=HOME_SIZE_TIMEOUT)
+            du_output = result.stdout.strip()
+            
+            sizes = {username: 0 for username in usernames}
+            for line in du_output.split('\n'):
+                parts = line.split('\t', 1)
+                if len(parts) == 2 and parts[1].startswith('/home/'):
+                    try:
+                        sizes[parts[1][len('/home/'):]] = int(parts[0])
+                    except ValueError:
+                        logger.warning("Error parsing du output line: %s", line)
+            
+            refreshed_at = time.monotonic()
+            for username, size in sizes.items():
+                self._du_cache[username] = (refreshed_at, size)
+        except Exception as e:
+            logger.warning("Error refreshing home directory sizes: %s", e)
+            # Keep the previous sizes but wait a full TTL, so a du that keeps timing out
+            # doesn't end up running on the server all the time
+            failed_at = time.monotonic()
+            for username in usernames:
+                self._du_cache[username] = (failed_at, self._du_cache.get(username, (0.0, 0))[1])
+        finally:
+            self._du_refreshing.difference_update(usernames)
+
+    def cpu_usage(self, idle: int, total: int) -> float:
+        """CPU usage percentage since the previous /proc/stat sample, or since boot on the first one"""
+        previous_idle, previous_total = self._cpu_sample or (0, 0)
+        self._cpu_sample = (idle, total)
+        elapsed = total - previous_total
+        if elapsed <= 0:
+            return 0.0
+        return round(100.0 * (1 - (idle - previous_idle) / elapsed), 1)
+
+    def start_gpu_stream(self):
+        """Start the background nvidia-smi stream unless it is already running"""
+        if self._gpu_task is None or self._gpu_task.done():
+            self._gpu_task = asyncio.create_task(self._stream_gpu_stats())
+
+    async def _stream_gpu_stats(self):
+        while True:
+            try:
+                async with self.borrow() as conn:
+                    # Prefer the NVML agent, fall back to nvidia-smi when it fails
+                    streamed = await self._read_gpu_stream(conn, GPU_AGENT_COMMAND, GPU_AGENT_SCRIPT)
+                    if not streamed:
+                        logger.info("NVML agent unavailable, streaming from nvidia-smi")
+                        streamed = await self._read_gpu_stream(conn, GPU_STREAM_COMMAND)
+                if streamed:
+                    logger.warning("GPU stream ended, restarting")
+                else:
+                    # Neither can run, e.g. no NVIDIA tools on the server, so back off like the GPU query
+                    self.gpu_backoff.failed()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("GPU stream failed: %s", e)
+            self._gpu_rows.clear()
+            self._gpu_users = None
+            await asyncio.sleep(GPU_STREAM_RETRY)
+            # Wait out the GPU backoff, failing GPU queries may extend it meanwhile
+            while self.gpu_backoff.is_open():
+                await asyncio.sleep(self.gpu_backoff.open_until - time.monotonic())
+
+    async def _read_gpu_stream(self, conn: asyncssh.SSHClientConnection, command: str, script: Optional[str] = None) -> bool:
+        """Record rows from a streaming GPU command until it exits, return whether it exited cleanly"""
+        async with conn.create_process(command) as process:
+            if script is not None:
+                process.stdin.write(script)
+                process.stdin.write_eof()
+            async for line in process.stdout:
+                row = line.strip()
+                if row.startswith(GPU_AGENT_USERS_PREFIX):
+                    fields = row.split()[1:]
+                    self._gpu_users = '\n'.join(f"{user} {mib}" for user, mib in zip(fields[::2], fields[1::2]))
+                    self._gpu_users_updated = time.monotonic()
+                elif row:
+                    self._gpu_rows[row.split(',', 1)[0]] = row
+                    self._gpu_updated = time.monotonic()
+            errors = (await process.stderr.read()).strip()
+            result = await process.wait()
+        if result.exit_status != 0:
+            logger.warning("GPU stream %r exited with status %s: %s", command, result.exit_status, errors)
+            return False
+        return True
+
+    def latest_gpu_output(self) -> Optional[str]:
+        """Latest nvidia-smi rows from the background stream, or None when they are stale"""
+        if not self._gpu_rows or time.monotonic() - self._gpu_updated > GPU_STREAM_MAX_AGE:
+            return None
+        return '\n'.join(self._gpu_rows.values())
+
+    def latest_gpu_users(self) -> Optional[str]:
+        """Latest GPU memory per user from the NVML agent, or None when stale or not streamed"""
+        if self._gpu_users is None or time.monotonic() - self._gpu_users_updated > GPU_STREAM_MAX_AGE:
+            return None
+        return self._gpu_users
+
+    async def close(self):
+        for task in list(self._du_tasks):
+            task.cancel()
+        if self._gpu_task is not None:
+            self._gpu_task.cancel()
+        if self._conn is not None:
+            self._conn.close()
+            await self._conn.wait_closed()
+            self._conn = None
+
+_pools: Dict[tuple, SSHConnectionPool] = {}
+
+def get_connection_pool(ssh_config: SSHConfig) -> SSHConnectionPool:
+    """Return the shared pool for the endpoint described by ssh_config"""
+    key = ssh_config.pool_key()
+    pool = _pools.get(key)
+    if pool is None:
+        pool = SSHConnectionPool(ssh_config)
+        _pools[key] = pool
+    return pool
+
+# The pool for SSH_CONFIG, looked up once at startup. Not at import, the pool's lock
+# has to be created inside the server's event loop on Python < 3.10
+_ssh_pool: Optional[SSHConnectionPool] = None
+
+def parse_gpu_names(output: str) -> Dict[str, str]:
+    """Map GPU index to name from the GPU_NAMES_QUERY output"""
+    return {row[0]: row[1] for row in csv.reader(io.StringIO(output), skipinitialspace=True) if len(row) >= 2}
+
+def parse_reading(value: str, convert=float):
+    """Convert a numeric nvidia-smi field, None for readings like [N/A] or [Not Supported]"""
+    try:
+        return convert(value)
+    except ValueError:
+        return None
+
+@dataclass
+class Gpu:
+    """One GPU as reported to the dashboard, memory in MiB"""
+    id: int
+    name: str
+    memory_used: int
+    memory_total: int
+    temperature: Optional[int]
+    power_usage: Optional[float]
+    processes: str = 'N/A'
+    user: str = 'N/A'
+
+def parse_nvidia_smi(output: str, gpu_names: Dict[str, str]) -> List[Gpu]:
     try:
         gpus = []
-        lines = output.strip().split('\n')
         
-        for line in lines:
-            if not line.strip():
-                continue
-                
-            parts = line.strip().split(',')
-            if len(parts) >= 6:
-                # Convert memory values to GB
-                memory_used_mb = float(parts[2].strip())
-                memory_total_mb = float(parts[3].strip())
-                memory_used_gb = memory_used_mb / 1024
-                memory_total_gb = memory_total_mb / 1024
-                
-                gpu = {
-                    'id': parts[0].strip(),
-                    'name': parts[1].strip(),
-                    'memory_used': f"{memory_used_gb:.1f}G",
-                    'memory_total': f"{memory_total_gb:.1f}G",
-                    'temperature': parts[4].strip(),
-                    'power_usage': parts[5].strip(),
-                    'processes': 'N/A',
-                    'user': 'N/A'
-                }
-                gpus.append(gpu)
+        for row in csv.reader(io.StringIO(output), skipinitialspace=True):
+            if len(row) >= 5:
+                gpu_id, memory_used, memory_total, temperature, power_usage = row[:5]
+                gpus.append(Gpu(
+                    id=int(gpu_id),
+                    name=gpu_names.get(gpu_id, 'N/A'),
+                    memory_used=int(memory_used),
+                    memory_total=int(memory_total),
+                    temperature=parse_reading(temperature, int),
+                    power_usage=parse_reading(power_usage),
+                ))
         
         return gpus
-    except Exception as e:
-        logger.error(f"Error parsing nvidia-smi output: {str(e)}")
-        logger.error(f"Output was: {output}")
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("Error parsing nvidia-smi output: %s", output)
         return []
 
-def get_system_resources(client: paramiko.SSHClient) -> Dict:
-    try:
-        # Force English locale for commands to ensure consistent parsing
-        locale_prefix = "LC_ALL=C "
-        
-        # Get disk usage - get all partitions and ensure they include /mnt mounts
-        stdin, stdout, stderr = client.exec_command(f"{locale_prefix}df -h | grep -v tmpfs | grep -v devtmpfs | grep -v snap | grep -v Filesystem", timeout=10)
-        disk_output = stdout.read().decode().strip()
-        stderr_output = stderr.read().decode()
-        if stderr_output:
-            logger.warning(f"Disk command stderr: {stderr_output}")
-            
-        # Also specifically check for disks mounted in /mnt
-        stdin, stdout, stderr = client.exec_command(f"{locale_prefix}df -h | grep '/mnt'", timeout=10)
-        mnt_disk_output = stdout.read().decode().strip()
+SECTION_MARKER = "__SEC__"
+
+# Sizes in bytes with a fixed column order, so no human readable sizes need parsing
+DF_OPTIONS = "-B1 --output=source,size,used,avail,pcent,target"
+
+# Commands needed for the system resources, run together in a single remote command
+SYSTEM_COMMANDS = {
+    # Get disk usage - all partitions, including the /mnt mounts
+    'df': f"df {DF_OPTIONS} | grep -vE 'tmpfs|devtmpfs|snap|Filesystem'",
+    'free': "free -m",
+    # Aggregate CPU time counters, turned into a usage percentage between two polls
+    'cpu_stat': "head -1 /proc/stat",
+}
+
+# Core count commands, only run until the pool has the count for its connection
+CPU_CORES_COMMANDS = {
+    'nproc': "nproc",
+    'lscpu': "lscpu | grep \"^CPU(s):\" | head -1",
+    'cpuinfo': "grep -c processor /proc/cpuinfo",
+}
+
+def split_sections(output: str, names) -> Dict[str, str]:
+    """Split batched output on its marker lines into the output of each named command"""
+    # Split on the marker lines in one pass instead of walking every output line, each
+    # chunk then starts with its section name followed by that command's output
+    sections = {name: '' for name in names}
+    for chunk in ('\n' + output).split('\n' + SECTION_MARKER)[1:]:
+        name, _, section_output = chunk.partition('\n')
+        if name in sections:
+            sections[name] = section_output.strip()
+    return sections
+
+async def run_batched(conn: asyncssh.SSHClientConnection, commands: Dict[str, str], timeout: int = 10) -> Dict[str, str]:
+    """Run several commands over one SSH channel and split their output per command"""
+    # The marker goes to stderr as well, so errors can be told apart per command
+    script = LOCALE_PREFIX + "; ".join(
+        f"echo '{SECTION_MARKER}{name}'; echo '{SECTION_MARKER}{name}' >&2; {command}"
+        for name, command in commands.items()
+    )
+    result = await conn.run(script, timeout=timeout)
+    if result.exit_status != 0:
+        logger.warning("Batched command exited with status %s", result.exit_status)
+    
+    # The exit status is only the last command's, so stderr is checked for every command
+    for name, errors in split_sections(result.stderr, commands).items():
+        if errors:
+            logger.warning("%s stderr: %s", name, errors)
+    
+    return split_sections(result.stdout, commands)
+
+BYTES_PER_GB = 1024 ** 3
+
+def format_size(num_bytes: int) -> str:
+    """Format a byte count for display, e.g. 944.0G or 1.8T"""
+    size_gb = num_bytes / BYTES_PER_GB
+    if size_gb >= 1024:
+        return f"{size_gb / 1024:.1f}T"
+    if size_gb >= 1:
+        return f"{size_gb:.1f}G"
+    return f"{size_gb * 1024:.1f}M"
+
+def parse_cpu_cores(outputs: Dict[str, str]) -> str:
+    """Parse the CPU_CORES_COMMANDS sections of a batched run"""
+    # Try to get CPU cores using nproc instead of lscpu
+    cpu_cores_output = outputs['nproc']
+    
+    if cpu_cores_output and cpu_cores_output.isdigit():
+        cpu_info = f"{cpu_cores_output} cores"
+    else:
+        # Fallback to lscpu if nproc fails
+        cpu_info_output = outputs['lscpu']
         
-        # Combine the outputs
-        if mnt_disk_output and not mnt_disk_output in disk_output:
-            disk_output = disk_output + "\n" + mnt_disk_output
+        try:
+            if ':' in cpu_info_output:
+                cpu_info = cpu_info_output.split(':')[1].strip() + " cores"
+            else:
+                # Try another approach
+                processor_count = outputs['cpuinfo']
+                if processor_count and processor_count.isdigit():
+                    cpu_info = f"{processor_count} cores"
+                else:
+                    cpu_info = 'N/A'
+                    logger.warning("CPU info format unexpected: %s", cpu_info_output)
+        except Exception as e:
+            cpu_info = 'N/A'
+            logger.warning("Failed to parse CPU info: %s", e)
+    
+    return cpu_info
+
+def get_system_resources(outputs: Dict[str, str], pool: SSHConnectionPool) -> Dict:
+    """Parse the SYSTEM_COMMANDS sections of a batched run"""
+    try:
+        disk_output = outputs['df']
         
         # Parse all disk partitions
         all_disks = []
@@ -174,73 +522,41 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
         total_storage_used = 0.0
         total_storage_available = 0.0
         try:
-            disk_lines = disk_output.strip().split('\n')
-            for line in disk_lines:
-                if not line.strip():
+            for line in disk_output.split('\n'):
+                # Format: Filesystem Size Used Avail Use% Mounted, sizes in bytes. Mount
+                # points may contain spaces, so only split off the first five columns
+                try:
+                    filesystem, size, used, available, percent, mount_point = line.split(None, 5)
+                    size_bytes = int(size)
+                    used_bytes = int(used)
+                    available_bytes = int(available)
+                except ValueError:
+                    if line.strip():
+                        logger.warning("Error parsing disk line: %s", line)
                     continue
+                
+                # df prints "-" instead of a percentage for filesystems without a size
+                percent = percent.rstrip('%')
+                usage_percent = int(percent) if percent.isdigit() else 0
+                
+                partition = {
+                    'filesystem': filesystem,
+                    'total': format_size(size_bytes),
+                    'used': format_size(used_bytes),
+                    'available': format_size(available_bytes),
+                    'usage_percent': usage_percent,
+                    'mount_point': mount_point
+                }
+                all_disks.append(partition)
+                
+                # Check if this is one of the storage disks we want
+                if mount_point in STORAGE_MOUNTS:
+                    storage_disks.append(partition)
                     
-                disk_info = line.split()
-                if len(disk_info) >= 6:  # Format: Filesystem Size Used Avail Use% Mounted
-                    try:
-                        # Extract usage percentage - handle different formats
-                        usage_percent_str = disk_info[4].replace('%', '')
-                        # Try to convert to int, default to 0 if it fails
-                        try:
-                            usage_percent = int(usage_percent_str)
-                        except ValueError:
-                            logger.warning(f"Could not parse disk usage percentage: {usage_percent_str}, defaulting to 0")
-                            usage_percent = 0
-                            
-                        partition = {
-                            'filesystem': disk_info[0],
-                            'total': disk_info[1],
-                            'used': disk_info[2],
-                            'available': disk_info[3],
-                            'usage_percent': usage_percent,
-                            'mount_point': disk_info[5]
-                        }
-                        all_disks.append(partition)
-                        
-                        # Check if this is one of the storage disks we want
-                        mount_point = disk_info[5]
-                        if '/mnt/storage_1_10T' in mount_point or '/mnt/storage_2_10T' in mount_point or '/mnt/user_disk' in mount_point:
-                            storage_disks.append(partition)
-                            
-                            # Try to convert sizes to numeric values for totals
-                            try:
-                                # Helper function to convert size strings like "11T", "944G", etc. to GB
-                                def size_to_gb(size_str):
-                                    if not size_str:
-                                        return 0.0
-                                    
-                                    # Remove any non-numeric prefix
-                                    numeric_part = ''.join(c for c in size_str if c.isdigit() or c == '.')
-                                    if not numeric_part:
-                                        return 0.0
-                                    
-                                    value = float(numeric_part)
-                                    
-                                    # Convert based on suffix
-                                    if 'T' in size_str:
-                                        return value * 1024  # TB to GB
-                                    elif 'G' in size_str:
-                                        return value  # Already GB
-                                    elif 'M' in size_str:
-                                        return value / 1024  # MB to GB
-                                    elif 'K' in size_str:
-                                        return value / (1024 * 1024)  # KB to GB
-                                    else:
-                                        return value  # Assume GB if no suffix
-                                
-                                # Add to totals
-                                total_storage_size += size_to_gb(disk_info[1])
-                                total_storage_used += size_to_gb(disk_info[2])
-                                total_storage_available += size_to_gb(disk_info[3])
-                            except Exception as e:
-                                logger.warning(f"Error calculating storage totals: {str(e)}")
-                    except Exception as e:
-                        logger.warning(f"Error parsing disk line: {line}, error: {str(e)}")
-                        continue
+                    # Add to totals
+                    total_storage_size += size_bytes / BYTES_PER_GB
+                    total_storage_used += used_bytes / BYTES_PER_GB
+                    total_storage_available += available_bytes / BYTES_PER_GB
             
             # Calculate storage usage percentage
             storage_usage_percent = 0
@@ -294,9 +610,8 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
                     'available': 'N/A',
                     'usage_percent': 0
                 }
-        except Exception as e:
-            logger.warning(f"Failed to parse disk info: {str(e)}")
-            logger.warning(traceback.format_exc())
+        except Exception:
+            logger.warning("Failed to parse disk info", exc_info=True)
             all_disks = []
             storage_disks = []
             storage_summary = {
@@ -313,19 +628,18 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
             }
         
         # Get memory usage
-        stdin, stdout, stderr = client.exec_command(f"{locale_prefix}free -m | grep Mem", timeout=10)
-        memory_output = stdout.read().decode().strip()
-        stderr_output = stderr.read().decode()
-        if stderr_output:
-            logger.warning(f"Memory command stderr: {stderr_output}")
+        memory_output = outputs['free']
         
-        # Safely parse memory info and convert to GB
+        # Safely parse memory info and convert to GB, looking columns up by their header
         try:
-            memory_info = memory_output.split()
-            if len(memory_info) >= 4:
-                total_mb = int(memory_info[1])
-                used_mb = int(memory_info[2])
-                free_mb = int(memory_info[3])
+            memory_lines = memory_output.split('\n')
+            header = memory_lines[0].split()
+            mem_row = next((line.split()[1:] for line in memory_lines if line.startswith('Mem:')), [])
+            memory_info = dict(zip(header, mem_row))
+            if all(column in memory_info for column in ('total', 'used', 'free')):
+                total_mb = int(memory_info['total'])
+                used_mb = int(memory_info['used'])
+                free_mb = int(memory_info['free'])
                 
                 # Convert to GB
                 total_gb = total_mb / 1024
@@ -339,7 +653,7 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
                     'usage_percent': round((used_mb / total_mb) * 100, 1) if total_mb > 0 else 0
                 }
             else:
-                logger.warning(f"Unexpected memory info format: {memory_output}")
+                logger.warning("Unexpected memory info format: %s", memory_output)
                 memory_usage = {
                     'total': '0G',
                     'used': '0G',
@@ -347,7 +661,7 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
                     'usage_percent': 0
                 }
         except Exception as e:
-            logger.warning(f"Failed to parse memory info: {str(e)}")
+            logger.warning("Failed to parse memory info: %s", e)
             memory_usage = {
                 'total': '0G',
                 'used': '0G',
@@ -355,56 +669,25 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
                 'usage_percent': 0
             }
         
-        # Get more accurate CPU usage
-        stdin, stdout, stderr = client.exec_command(f"{locale_prefix}top -bn1 | head -5 | grep -i cpu", timeout=10)
-        cpu_output = stdout.read().decode().strip()
-        stderr_output = stderr.read().decode()
-        if stderr_output:
-            logger.warning(f"CPU command stderr: {stderr_output}")
+        # Get CPU usage from the counters: cpu user nice system idle iowait irq softirq steal
+        cpu_output = outputs['cpu_stat']
         
         # Safely parse CPU usage
         try:
-            # Look for idle percentage in CPU output
-            import re
-            matches = re.search(r"(\d+\.\d+)\s*id", cpu_output)
-            if matches:
-                idle_percent = float(matches.group(1))
-                cpu_usage = round(100.0 - idle_percent, 1)
-            else:
-                # Fallback method
-                stdin, stdout, stderr = client.exec_command(f"{locale_prefix}top -bn1 | grep \"Cpu(s)\" | sed \"s/.*, *\\([0-9.]*\\)%* id.*/\\1/\" | awk '{{print 100 - $1}}'", timeout=10)
-                cpu_output = stdout.read().decode().strip()
-                cpu_usage = float(cpu_output) if cpu_output else 0
+            counters = [int(value) for value in cpu_output.split()[1:9]]
+            idle = counters[3] + counters[4]
+            cpu_usage = pool.cpu_usage(idle, sum(counters))
         except Exception as e:
-            logger.warning(f"Failed to parse CPU usage: {str(e)}")
+            logger.warning("Failed to parse CPU usage: %s", e)
             cpu_usage = 0
         
-        # Try to get CPU cores using nproc instead of lscpu
-        stdin, stdout, stderr = client.exec_command(f"{locale_prefix}nproc", timeout=10)
-        cpu_cores_output = stdout.read().decode().strip()
-        
-        if cpu_cores_output and cpu_cores_output.isdigit():
-            cpu_info = f"{cpu_cores_output} cores"
+        # The core count doesn't change while connected, so it is only parsed once
+        if pool.cpu_cores is None:
+            cpu_info = parse_cpu_cores(outputs)
+            if cpu_info != 'N/A':
+                pool.cpu_cores = cpu_info
         else:
-            # Fallback to lscpu if nproc fails
-            stdin, stdout, stderr = client.exec_command(f"{locale_prefix}lscpu | grep \"^CPU(s):\" | head -1", timeout=10)
-            cpu_info_output = stdout.read().decode().strip()
-            
-            try:
-                if ':' in cpu_info_output:
-                    cpu_info = cpu_info_output.split(':')[1].strip() + " cores"
-                else:
-                    # Try another approach
-                    stdin, stdout, stderr = client.exec_command(f"{locale_prefix}grep -c processor /proc/cpuinfo", timeout=10)
-                    processor_count = stdout.read().decode().strip()
-                    if processor_count and processor_count.isdigit():
-                        cpu_info = f"{processor_count} cores"
-                    else:
-                        cpu_info = 'N/A'
-                        logger.warning(f"CPU info format unexpected: {cpu_info_output}")
-            except Exception as e:
-                cpu_info = 'N/A'
-                logger.warning(f"Failed to parse CPU info: {str(e)}")
+            cpu_info = pool.cpu_cores
         
         return {
             'disk': disk_usage,
@@ -417,9 +700,8 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
                 'cores': cpu_info
             }
         }
-    except Exception as e:
-        logger.error(f"Error getting system resources: {str(e)}")
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("Error getting system resources")
         return {
             'disk': {'total': 'N/A', 'used': 'N/A', 'available': 'N/A', 'usage_percent': 0},
             'all_disks': [],
@@ -429,82 +711,71 @@ def get_system_resources(client: paramiko.SSHClient) -> Dict:
             'cpu': {'usage_percent': 0, 'cores': 'N/A'}
         }
 
-def get_user_resources(client: paramiko.SSHClient) -> List[Dict]:
-    """Get resource usage for each active user"""
+# Commands needed for the per-user resources. The users loop runs server side and
+# prints one tab separated line per user: name, cpu%, mem%. GPU memory is summed per
+# process owner on the server as well, one "user MiB" line per user
+USER_COMMANDS = {
+    'who': "who",
+    'users': (
+        "for u in $(who | awk '{print $1}' | sort -u); do "
+        "usage=$(ps -u \"$u\" -o %cpu=,%mem= | awk '{c += $1; m += $2} END {printf \"%.1f\\t%.1f\", c, m}'); "
+        "printf '%s\\t%s\\n' \"$u\" \"$usage\"; "
+        "done"
+    ),
+    'gpu_users': (
+        "nvidia-smi --query-compute-apps=pid,used_memory --format=csv,noheader,nounits | "
+        "while IFS=', ' read -r pid mem; do echo \"$(ps -o user:32= -p \"$pid\") $mem\"; done | "
+        "awk 'NF == 2 {a[$1] += $2} END {for (u in a) print u, a[u]}'"
+    ),
+}
+
+def get_user_resources(outputs: Dict[str, str], pool: SSHConnectionPool) -> List[Dict]:
+    """Get resource usage for each active user from the USER_COMMANDS sections of a batched run"""
     try:
-        locale_prefix = "LC_ALL=C "
         active_users = []
         
-        # Get list of active users
-        stdin, stdout, stderr = client.exec_command(f"{locale_prefix}who", timeout=10)
-        who_output = stdout.read().decode().strip()
+        # Group the who sessions by user in a single pass
+        sessions_by_user = defaultdict(list)
+        for line in outputs['who'].split('\n'):
+            matches = _WHO_LINE_RE.match(line)
+            if matches:
+                sessions_by_user[matches.group(1)].append({
+                    'terminal': matches.group(2),
+                    'date': ' '.join(matches.group(3).split()),
+                    'from': matches.group(4) or 'N/A'
+                })
+        
+        # GPU memory used by each user's compute processes, already summed on the server
+        gpu_memory_by_user = {}
+        for line in outputs.get('gpu_users', '').split('\n'):
+            parts = line.split()
+            if len(parts) == 2:
+                try:
+                    gpu_memory_by_user[parts[0]] = int(parts[1])
+                except ValueError as e:
+                    logger.warning("Error parsing GPU memory for user %s: %s", parts[0], e)
         
-        # Parse the who output to get usernames
-        usernames = set()
-        for line in who_output.split('\n'):
-            if line.strip():
-                parts = line.split()
-                if parts:
-                    usernames.add(parts[0])
+        user_lines = [line.split('\t') for line in outputs['users'].split('\n')]
+        user_lines = [fields for fields in user_lines if len(fields) >= 3]
         
-        # For each user, get resource usage
-        for username in usernames:
-            # Get CPU and memory usage with ps
-            cmd = f"{locale_prefix}ps aux | grep ^{username} | awk '{{cpu_sum += $3; mem_sum += $4}} END {{print cpu_sum, mem_sum}}'"
-            stdin, stdout, stderr = client.exec_command(cmd, timeout=10)
-            ps_output = stdout.read().decode().strip()
+        # Home directory sizes come from a long lived cache, du is far too slow to run per poll
+        home_sizes = pool.home_sizes([fields[0] for fields in user_lines])
+        
+        # For each user, parse the resource usage line
+        for fields in user_lines:
+            username = fields[0]
             
             cpu_usage = 0.0
             memory_usage = 0.0
+            try:
+                cpu_usage = float(fields[1])
+                memory_usage = float(fields[2])
+            except Exception as e:
+                logger.warning("Error parsing ps output for user %s: %s", username, e)
             
-            if ps_output:
-                try:
-                    parts = ps_output.split()
-                    if len(parts) >= 2:
-                        cpu_usage = float(parts[0])
-                        memory_usage = float(parts[1])
-                except Exception as e:
-                    logger.warning(f"Error parsing ps output for user {username}: {str(e)}")
-            
-            # Get GPU usage with nvidia-smi
-            cmd = f"{locale_prefix}nvidia-smi --query-compute-apps=pid,used_memory --format=csv,noheader,nounits"
-            stdin, stdout, stderr = client.exec_command(cmd, timeout=10)
-            nvidia_output = stdout.read().decode().strip()
-            
-            # Get PIDs owned by this user
-            cmd = f"{locale_prefix}ps -u {username} -o pid= | tr '\n' ',' | sed 's/,$//'"
-            stdin, stdout, stderr = client.exec_command(cmd, timeout=10)
-            user_pids = stdout.read().decode().strip().split(',')
-            
-            gpu_memory_usage = 0
-            
-            # Parse nvidia-smi output and match PIDs to this user
-            if nvidia_output and user_pids:
-                for line in nvidia_output.split('\n'):
-                    if not line.strip():
-                        continue
-                        
-                    parts = line.split(',')
-                    if len(parts) >= 2:
-                        pid = parts[0].strip()
-                        if pid in user_pids:
-                            try:
-                                memory = int(parts[1].strip())
-                                gpu_memory_usage += memory
-                            except Exception as e:
-                                logger.warning(f"Error parsing GPU memory for PID {pid}: {str(e)}")
+            gpu_memory_usage = gpu_memory_by_user.get(username, 0)
             
-            # Get storage usage with du
-            cmd = f"{locale_prefix}du -s /home/{username} 2>/dev/null || echo '0'"
-            stdin, stdout, stderr = client.exec_command(cmd, timeout=10)
-            storage_output = stdout.read().decode().strip()
-            
-            storage_usage = 0
-            if storage_output:
-                try:
-                    storage_usage = int(storage_output.split()[0]) / (1024 * 1024)  # Convert KB to GB
-                except Exception as e:
-                    logger.warning(f"Error parsing storage usage for user {username}: {str(e)}")
+            storage_usage = home_sizes.get(username, 0) / (1024 * 1024)  # Convert KB to GB
             
             # Create user resource dict
             user_resources = {
@@ -513,84 +784,185 @@ def get_user_resources(client: paramiko.SSHClient) -> List[Dict]:
                 'memory_usage': round(memory_usage, 1),
                 'gpu_memory_usage': gpu_memory_usage,
                 'storage_usage': round(storage_usage, 2),
-                'sessions': []
+                'sessions': sessions_by_user[username]
             }
             
-            # Add session details
-            for line in who_output.split('\n'):
-                if line.strip() and line.split()[0] == username:
-                    try:
-                        parts = line.split()
-                        session = {
-                            'terminal': parts[1] if len(parts) > 1 else 'N/A',
-                            'date': ' '.join(parts[2:5]) if len(parts) > 4 else 'N/A',
-                            'from': parts[5].strip('()') if len(parts) > 5 and '(' in parts[5] else 'N/A'
-                        }
-                        user_resources['sessions'].append(session)
-                    except Exception as e:
-                        logger.warning(f"Error parsing session info for {username}: {str(e)}")
-            
             active_users.append(user_resources)
         
         return active_users
-    except Exception as e:
-        logger.error(f"Error getting user resources: {str(e)}")
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("Error getting user resources")
         return []
 
-@app.get("/api/gpu-status")
-async def get_gpu_status():
+# Everything a status poll needs, sent as one remote command. The GPU query is only
+# added when the background nvidia-smi stream has no fresh rows, and the static host
+# facts only until the pool has them for its connection
+STATUS_COMMANDS = {**SYSTEM_COMMANDS, **USER_COMMANDS}
+
+async def collect_gpu_status() -> Dict:
     """
     Get GPU status information via SSH connection.
     """
-    ssh_config = SSHConfig()
-    client = None
+    pool = _ssh_pool
     
     try:
-        # Try to get SSH client
-        client = ssh_config.get_client()
-        
-        # Get GPU information
-        logger.info("Executing nvidia-smi command")
-        stdin, stdout, stderr = client.exec_command('nvidia-smi --query-gpu=index,name,memory.used,memory.total,temperature.gpu,power.draw --format=csv,noheader,nounits', timeout=10)
-        gpu_info = stdout.read().decode()
-        stderr_output = stderr.read().decode()
-        if stderr_output:
-            logger.warning(f"nvidia-smi stderr: {stderr_output}")
-        
-        # Get user information
-        logger.info("Executing who command")
-        stdin, stdout, stderr = client.exec_command('who', timeout=10)
-        user_info = stdout.read().decode()
-        stderr_output = stderr.read().decode()
-        if stderr_output:
-            logger.warning(f"who command stderr: {stderr_output}")
-        
-        # Get system resources
-        logger.info("Getting system resources")
-        system_resources = get_system_resources(client)
+        # A pooled connection can die between polls, so reconnect once before giving up
+        for attempt in range(2):
+            try:
+                # Borrow the live SSH connection from the pool
+                pool.start_gpu_stream()
+                gpu_output = pool.latest_gpu_output()
+                gpu_users_output = pool.latest_gpu_users()
+                # No nvidia-smi command runs while GPU queries are paused after failures, and
+                # GPU memory per user isn't queried while the NVML agent streams it
+                gpu_available = gpu_output is not None or not pool.gpu_backoff.is_open()
+                commands = dict(STATUS_COMMANDS)
+                if not gpu_available or gpu_users_output is not None:
+                    del commands['gpu_users']
+                if gpu_available and gpu_output is None:
+                    commands['gpu'] = GPU_QUERY
+                
+                async with pool.borrow() as conn:
+                    if pool.gpu_names is None and gpu_available:
+                        commands['gpu_names'] = GPU_NAMES_QUERY
+                    if pool.cpu_cores is None:
+                        commands.update(CPU_CORES_COMMANDS)
+                    
+                    # Get GPU, user, system and per-user resource information in one round trip
+                    logger.debug("Executing status commands")
+                    outputs = await run_batched(conn, commands)
+                break
+            except CONNECTION_ERRORS as e:
+                if attempt:
+                    raise
+                logger.warning("Pooled SSH connection failed, reconnecting: %s", e)
         
-        # Get user resources
-        logger.info("Getting user resources")
-        user_resources = get_user_resources(client)
+        if gpu_users_output is not None:
+            outputs['gpu_users'] = gpu_users_output
         
-        gpus = parse_nvidia_smi(gpu_info)
+        # Only cache names that were actually read, so a failed query is retried next poll
+        if 'gpu_names' in outputs:
+            pool.gpu_names = parse_gpu_names(outputs['gpu_names']) or None
+        if gpu_output is not None:
+            gpus = parse_nvidia_smi(gpu_output, pool.gpu_names or {})
+            pool.gpu_backoff.succeeded()
+        elif 'gpu' in outputs:
+            gpus = parse_nvidia_smi(outputs['gpu'], pool.gpu_names or {})
+            if gpus:
+                pool.gpu_backoff.succeeded()
+            else:
+                pool.gpu_backoff.failed()
+        else:
+            gpus = []
+        system_resources = get_system_resources(outputs, pool)
+        user_resources = get_user_resources(outputs, pool)
         
         return {
             "gpus": gpus,
-            "active_users": user_info.strip().split('\n'),
+            "active_users": outputs['who'].split('\n'),
             "user_resources": user_resources,
             "system_resources": system_resources
         }
     except Exception as e:
-        logger.error(f"Unexpected error in get_gpu_status: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Unexpected error in get_gpu_status")
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
+
+# Seconds between status collections made by the background poller
+STATUS_POLL_INTERVAL = float(os.getenv("STATUS_POLL_INTERVAL", "3"))
+# Older statuses mean the poller is failing or stuck, requests then collect themselves
+STATUS_MAX_AGE = 3 * STATUS_POLL_INTERVAL
+
+# Served while collections are skipped, with the last known status when there is one
+EMPTY_STATUS = {"gpus": [], "active_users": [], "user_resources": [], "system_resources": {}}
+
+_status_cache = {"ts": 0.0, "data": None}
+# Requests and the poller skip collections for a while after they failed
+_status_backoff = Backoff("Status collection")
+_status_refresh: Optional[asyncio.Task] = None
+_status_poller: Optional[asyncio.Task] = None
+
+def _cached_status():
+    if _status_cache["data"] is not None and time.monotonic() - _status_cache["ts"] < STATUS_MAX_AGE:
+        return _status_cache["data"]
+    return None
+
+async def _refresh_status() -> Dict:
+    global _status_refresh
+    try:
+        data = await collect_gpu_status()
+    except Exception:
+        _status_backoff.failed()
+        raise
     finally:
-        if client:
-            client.close()
-            logger.info("SSH connection closed")
+        _status_refresh = None
+    _status_backoff.succeeded()
+    _status_cache["data"] = data
+    _status_cache["ts"] = time.monotonic()
+    return data
+
+def _shared_refresh() -> asyncio.Task:
+    """Return the running collection, starting one if none is in flight"""
+    global _status_refresh
+    # Only one collection runs at a time, callers arriving meanwhile share its result or error
+    if _status_refresh is None:
+        _status_refresh = asyncio.ensure_future(_refresh_status())
+    return _status_refresh
+
+async def _poll_status():
+    while True:
+        try:
+            if not _status_backoff.is_open():
+                await _shared_refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Already logged by collect_gpu_status, try again on the next round
+            pass
+        await asyncio.sleep(STATUS_POLL_INTERVAL)
+
+@app.get("/api/gpu-status")
+async def get_gpu_status():
+    """
+    Get GPU status information as last collected by the background poller.
+    """
+    data = _cached_status()
+    if data is not None:
+        return data
+    
+    # The server kept failing recently, don't make this request wait for another failure
+    if _status_backoff.is_open():
+        return {**(_status_cache["data"] or EMPTY_STATUS), "error": "upstream_unavailable"}
+    
+    # Nothing recent yet, e.g. right after startup, so wait for a collection.
+    # Shielded so a client disconnecting doesn't cancel the collection for everyone else
+    return await asyncio.shield(_shared_refresh())
+
+async def start_background_tasks():
+    global _status_poller, _ssh_pool
+    _ssh_pool = get_connection_pool(SSH_CONFIG)
+    _ssh_pool.start_gpu_stream()
+    _status_poller = asyncio.create_task(_poll_status())
+
+async def close_ssh_connections():
+    if _status_poller is not None:
+        _status_poller.cancel()
+    for pool in _pools.values():
+        await pool.close()
+    _pools.clear()
+    logger.info("SSH connections closed")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Each worker process keeps its own SSH connection, GPU stream and status cache
+    workers = int(os.getenv("WORKERS", "1"))
+    # Several workers need an import string, a single one runs this module's app so it
+    # isn't imported a second time as "main"
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        access_log=False,
+    ) 
\ No newline at end of file
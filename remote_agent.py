@@ -0,0 +1,80 @@
+"""
+Stream GPU metrics from NVML, run on the monitored server.
+
+main.py sends this script over SSH on stdin (python3 -u - --interval 1), so nothing
+has to be installed remotely besides pynvml. NVML is initialised once and each tick
+prints one row per GPU in the same format as the nvidia-smi GPU query:
+index, memory used (MiB), memory total (MiB), temperature (C), power draw (W)
+followed by the GPU memory of compute processes summed per owner:
+users <name> <MiB> <name> <MiB> ...
+"""
+import argparse
+import os
+import pwd
+import time
+from collections import defaultdict
+
+import pynvml
+
+
+def read_temperature(handle):
+    try:
+        return pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+    except pynvml.NVMLError:
+        return "[N/A]"
+
+
+def read_power(handle):
+    try:
+        return f"{pynvml.nvmlDeviceGetPowerUsage(handle) / 1000:.2f}"  # mW to W
+    except pynvml.NVMLError:
+        return "[N/A]"
+
+
+def process_owner(pid):
+    uid = os.stat(f"/proc/{pid}").st_uid
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def read_user_memory(handles):
+    """GPU memory in MiB used by compute processes, summed per process owner"""
+    usage = defaultdict(int)
+    for handle in handles:
+        for process in pynvml.nvmlDeviceGetComputeRunningProcesses(handle):
+            try:
+                usage[process_owner(process.pid)] += (process.usedGpuMemory or 0) // 2**20
+            except OSError:
+                # The process exited meanwhile or isn't visible from here
+                continue
+    return usage
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    pynvml.nvmlInit()
+    try:
+        handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+        while True:
+            for index, handle in enumerate(handles):
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                print(f"{index}, {memory.used // 2**20}, {memory.total // 2**20}, {read_temperature(handle)}, {read_power(handle)}", flush=True)
+            try:
+                usage = read_user_memory(handles)
+            except pynvml.NVMLError:
+                # Without the users line main.py queries nvidia-smi for them instead
+                pass
+            else:
+                print(" ".join(["users"] + [f"{user} {mib}" for user, mib in usage.items()]), flush=True)
+            time.sleep(args.interval)
+    finally:
+        pynvml.nvmlShutdown()
+
+
+if __name__ == "__main__":
+    main()